@@ -2,12 +2,18 @@ import streamlit as st
 import pandas as pd
 import os
 import base64
+import io
+from workbook_reader import check_sheet_pattern, read_workbook_sheets, concat_sheets
 
 # Function to extract data from Excel files
-def extract_data(file):
+def extract_data(file, all_sheets=False, sheet_pattern=None):
     try:
-        data = pd.read_excel(file.getvalue())
         columns = ['MeterNo', 'AccountNo.', 'CONSUMPTION', 'Previous Reading', 'Current Reading', 'READ STATUS', 'District']
+        if all_sheets:
+            data = concat_sheets(read_workbook_sheets(io.BytesIO(file.getvalue()), pattern=sheet_pattern))
+            columns = columns + ['Sheet']
+        else:
+            data = pd.read_excel(file.getvalue())
         extracted_data = data[columns]
         extracted_data['File'] = os.path.basename(file.name)
         return extracted_data
@@ -27,6 +33,13 @@ def main():
     st.title("Extract Data from Excel Files")
 
     files = st.file_uploader("Upload Excel files", accept_multiple_files=True, type=['xlsx', 'xls'])
+    read_all_sheets = st.checkbox("Read every sheet of each workbook (not just the first)")
+    sheet_pattern = st.text_input("Only sheets whose name matches (regex, optional)") if read_all_sheets else ""
+    try:
+        check_sheet_pattern(sheet_pattern)
+    except ValueError as e:
+        st.error(str(e))
+        return
 
     if files:
         data = pd.DataFrame()
@@ -34,7 +47,7 @@ def main():
 
         for file in files:
             st.info(f"Processing file: {file.name}")
-            extracted = extract_data(file)
+            extracted = extract_data(file, read_all_sheets, sheet_pattern)
             if not extracted.empty:
                 data = pd.concat([data, extracted], ignore_index=True)
                 any_file_processed = True
@@ -8,6 +8,7 @@ import re
 from collections import defaultdict
 import tempfile
 import shutil
+from workbook_reader import check_sheet_pattern, read_workbook_sheets, concat_sheets
 
 st.set_page_config(page_title="Excel Merger + Summary", layout="centered")
 st.title("📦 Merge ZIPs → Excel Sheets + Summary + ZIP Export")
@@ -19,6 +20,15 @@ uploaded_zips = st.file_uploader(
     accept_multiple_files=True
 )
 
+read_all_sheets = st.checkbox("Read every sheet of each Excel workbook (not just the first)")
+sheet_pattern = st.text_input("Only sheets whose name matches (regex, optional):") if read_all_sheets else ""
+
+try:
+    check_sheet_pattern(sheet_pattern)
+except ValueError as e:
+    st.error(f"❌ {e}")
+    st.stop()
+
 def clean_sheet_name(name):
     name = Path(name).stem
     name = re.sub(r'[^A-Za-z0-9_]', '_', name)
@@ -61,7 +71,7 @@ def extract_zip_files(zip_file):
         raise RuntimeError(f"Cannot extract `{zip_file.name}` – Bad ZIP format.")
 
 @st.cache_resource
-def process_all_zips(zips):
+def process_all_zips(zips, all_sheets=False, sheet_pattern=None):
     summary_dict = defaultdict(dict)
     summary_table_raw = []
     zip_outputs = {}
@@ -97,10 +107,21 @@ def process_all_zips(zips):
                             suffix = Path(filename).suffix.lower()
                             if suffix == ".csv":
                                 df = pd.read_csv(file_obj, header=None, low_memory=False, dtype=str)
+                                data_cleaned, count = detect_data_and_count_rows(df)
+                            elif all_sheets:
+                                # Detect the header on each sheet before stacking them
+                                sheets = read_workbook_sheets(file_obj, pattern=sheet_pattern, header=None)
+                                detected = {}
+                                for name, sheet_df in sheets.items():
+                                    detected[name], sheet_count = detect_data_and_count_rows(sheet_df)
+                                    if sheet_count == 0:
+                                        error_logs.write(f"❌ Sheet `{name}` in {filename} inside {zip_file.name}: no header or data rows found, skipped\n")
+                                data_cleaned = concat_sheets(detected)
+                                count = len(data_cleaned)
                             else:
                                 df = pd.read_excel(file_obj, header=None)
+                                data_cleaned, count = detect_data_and_count_rows(df)
 
-                            data_cleaned, count = detect_data_and_count_rows(df)
                             if count == 0:
                                 raise ValueError("No data rows found below detected header.")
 
@@ -155,9 +176,12 @@ def process_all_zips(zips):
 
 # 🔄 Main Logic
 if uploaded_zips:
-    if "processed_outputs" not in st.session_state:
+    # Reprocess when the sheet options change so results never go stale
+    sheet_options = (read_all_sheets, sheet_pattern)
+    if "processed_outputs" not in st.session_state or st.session_state.get("processed_options") != sheet_options:
         with st.spinner("Processing ZIPs. This may take time..."):
-            st.session_state["processed_outputs"] = process_all_zips(uploaded_zips)
+            st.session_state["processed_outputs"] = process_all_zips(uploaded_zips, read_all_sheets, sheet_pattern)
+            st.session_state["processed_options"] = sheet_options
 
     zip_outputs, summary_df, pivot_summary, error_content, zip_bundle_path = st.session_state["processed_outputs"]
 
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+
+_MISSING_TOKENS = ['', 'nan', 'none', 'null', 'nat']
+_DECIMAL_PATTERN = r'^\+?(-?)0*(\d*)\.(\d*?)0*$'
+_SCIENTIFIC_PATTERN = r'[+-]?(?:\d+\.?\d*|\.\d+)E[+-]?\d+'
+
+# Function to normalize IDs such as "0123", "123.0", "1.23E+2" or " 123 " to one canonical string
+def canonicalize_keys(values):
+    # Digit and decimal strings are normalized as text so long IDs never lose precision
+    # through float; scientific forms only collapse when they hold an exact whole number
+    keys = pd.Series(values, copy=False).astype('string')
+    keys = keys.str.replace(r'\s+', '', regex=True).str.upper()
+    keys = keys.mask(keys.str.lower().isin(_MISSING_TOKENS))
+
+    digits = keys.str.fullmatch(r'\d+').fillna(False).astype(bool)
+    keys = keys.mask(digits, keys.str.lstrip('0').replace('', '0'))
+
+    # "0123.50" -> "123.5", "123.0" -> "123", ".5" -> "0.5"
+    decimal = (keys.str.fullmatch(r'[+-]?\d*\.\d*') & keys.str.contains(r'\d')).fillna(False).astype(bool)
+    parts = keys.where(decimal).str.extract(_DECIMAL_PATTERN)
+    fraction = parts[2].fillna('')
+    normalized = parts[0] + parts[1].replace('', '0') + ('.' + fraction).where(fraction != '', '')
+    keys = keys.mask(decimal, normalized)
+
+    scientific = keys.str.fullmatch(_SCIENTIFIC_PATTERN).fillna(False).astype(bool)
+    numbers = pd.to_numeric(keys.where(scientific), errors='coerce')
+    whole = scientific & numbers.notna() & (numbers == np.floor(numbers)) & (numbers.abs() < 2 ** 53)
+    return keys.mask(whole, numbers.where(whole).astype('Int64').astype('string'))
+
+# Function to build the sorted hash index of every canonical key seen across sources
+def build_key_index(*canonical_keys):
+    keys = pd.concat([pd.Series(k, dtype='string') for k in canonical_keys], ignore_index=True)
+    return pd.Index(keys.dropna().unique().astype(object)).sort_values()
+
+# Function to encode canonical keys as compact integer codes (-1 for missing keys)
+def encode_keys(canonical_keys, key_index):
+    codes = key_index.get_indexer(pd.Series(canonical_keys, dtype='string').astype(object))
+    return codes.astype(np.int32 if len(key_index) < np.iinfo(np.int32).max else np.int64)
+
+# Function to list keys repeated within one source file, flagging keys spelt more than one way
+def key_report(df, raw_column, code_column, key_index, source_column):
+    columns = [source_column, 'Column', 'Key', 'Rows', 'Raw Values', 'Issue']
+    keyed = df.loc[df[code_column] >= 0, [source_column, code_column, raw_column]]
+    repeated = keyed[keyed.duplicated([source_column, code_column], keep=False)]
+    if repeated.empty:
+        return pd.DataFrame(columns=columns)
+
+    report = repeated.groupby([source_column, code_column], sort=False)[raw_column].agg(
+        Rows='size',
+        Spellings='nunique',
+        **{'Raw Values': lambda s: ', '.join(sorted(s.dropna().astype(str).unique()))},
+    ).reset_index()
+    report['Column'] = raw_column
+    report['Key'] = key_index.take(report[code_column])
+    report['Issue'] = np.where(report['Spellings'] > 1, 'conflict', 'duplicate')
+    return report[columns]
+
+# Function to outer-join several files on the canonical integer codes of one ID column
+def merge_on_canonical_key(base, others, column, source_column='File'):
+    sources = [base] + list(others.values())
+    canonical = [canonicalize_keys(data[column]) for data in sources]
+    key_index = build_key_index(*canonical)
+    codes = [encode_keys(keys, key_index).astype(np.int64) for keys in canonical]
+
+    keyed = pd.concat([data[[source_column, column]].assign(_key=code) for data, code in zip(sources, codes)], ignore_index=True)
+    report = key_report(keyed, column, '_key', key_index, source_column)
+
+    # Rows with a missing ID each get their own negative code so they never match one another
+    next_missing = -1
+    for code in codes:
+        missing = code < 0
+        code[missing] = np.arange(next_missing, next_missing - missing.sum(), -1)
+        next_missing -= missing.sum()
+
+    merged = base.assign(_key=codes[0])
+    for (name, data), code in zip(others.items(), codes[1:]):
+        data = data.drop(columns=[column]).assign(_key=code)
+        merged = pd.merge(merged, data, how='outer', on='_key', suffixes=('', f'_{name}'))
+
+    # IDs missing from the base file take their canonical value
+    backfill = merged[column].isna() & merged['_key'].ge(0)
+    merged.loc[backfill, column] = key_index.take(merged.loc[backfill, '_key'])
+    return merged.drop(columns=['_key']), report
@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 import base64
+from key_index import merge_on_canonical_key
 
 # Function to extract data from Excel files
 def extract_data(file, columns):
@@ -15,14 +16,24 @@ def extract_data(file, columns):
 
 # Function to merge data based on AccountNo.
 def merge_data(base_data, other_files, columns_to_extract):
-    merged_data = base_data.copy()
+    if base_data.empty:
+        return base_data
 
+    other_data = {}
     for file in other_files:
         st.info(f"Processing file: {file.name}")
-        other_data = extract_data(file, ['AccountNo.', 'MeterNo'] + columns_to_extract)
-        if not other_data.empty:
-            merged_data = pd.merge(merged_data, other_data, how='outer', on='AccountNo.', suffixes=('', f'_{file.name}'))
-            st.success(f"File {file.name} processed successfully!")
+        extracted = extract_data(file, ['AccountNo.', 'MeterNo'] + columns_to_extract)
+        if not extracted.empty:
+            other_data[file.name] = extracted
+
+    # Join every file on canonical AccountNo. keys so "0123", "123.0" and "1.23E+2" match
+    merged_data, report = merge_on_canonical_key(base_data, other_data, 'AccountNo.')
+    if not report.empty:
+        st.warning(f"Found {len(report)} duplicate or conflicting AccountNo. key(s); these rows may repeat in the merge.")
+        st.dataframe(report)
+
+    for name in other_data:
+        st.success(f"File {name} processed successfully!")
 
     return merged_data
 
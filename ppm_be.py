@@ -1,5 +1,7 @@
 import streamlit as st
 import pandas as pd
+from key_index import canonicalize_keys, build_key_index, encode_keys, key_report
+from workbook_reader import check_sheet_pattern, read_workbook_sheets, concat_sheets
 
 st.title('PPM BAND EXTRACT')
 
@@ -8,12 +10,18 @@ def normalize_columns(columns):
     return [col.lower() for col in columns]
 
 # Function to process a single file
-def process_file(file, file_label):
-    df = pd.read_excel(file)
+def process_file(file, file_label, all_sheets=False, sheet_pattern=None):
+    if all_sheets:
+        df = concat_sheets(read_workbook_sheets(file, pattern=sheet_pattern, dtype=str), sheet_column='source_sheet')
+    else:
+        df = pd.read_excel(file, dtype=str)  # Read IDs as strings so leading zeros and raw spellings survive
     df.columns = normalize_columns(df.columns)
     
     # Select required columns and rename them for consistency
-    df_selected = df[['meterno', 'custacc', 'district', 'tariff']].copy()
+    required_columns = ['meterno', 'custacc', 'district', 'tariff']
+    if all_sheets:
+        required_columns.append('source_sheet')
+    df_selected = df[required_columns].copy()
     
     # Add a column for the BAND derived from the TARIFF column
     df_selected['band'] = df_selected['tariff'].apply(lambda x: x[4] if len(x) > 4 else None)
@@ -25,6 +33,14 @@ def process_file(file, file_label):
 
 # File uploader
 uploaded_files = st.file_uploader("Upload Excel files", accept_multiple_files=True, type=['xlsx'])
+read_all_sheets = st.checkbox("Read every sheet of each workbook (not just the first)")
+sheet_pattern = st.text_input("Only sheets whose name matches (regex, optional)") if read_all_sheets else ""
+
+try:
+    check_sheet_pattern(sheet_pattern)
+except ValueError as e:
+    st.error(f"❌ {e}")
+    st.stop()
 
 if uploaded_files:
     combined_df = pd.DataFrame()
@@ -32,17 +48,49 @@ if uploaded_files:
     # Process each uploaded file
     for uploaded_file in uploaded_files:
         file_label = uploaded_file.name
-        processed_df = process_file(uploaded_file, file_label)
+        try:
+            processed_df = process_file(uploaded_file, file_label, read_all_sheets, sheet_pattern)
+        except Exception as e:
+            st.error(f"Error processing file {file_label}: {str(e)}")
+            continue
         combined_df = pd.concat([combined_df, processed_df], ignore_index=True)
     
-    # Sort by meterno and custacc to detect changes
-    combined_df = combined_df.sort_values(by=['meterno', 'custacc'])
+    if combined_df.empty:
+        st.warning("No files were processed successfully. Please check the errors and try again.")
+        st.stop()
+    
+    # Canonicalize meterno and custacc into compact integer keys so padded or reformatted IDs still match
+    meter_keys = canonicalize_keys(combined_df['meterno'])
+    account_keys = canonicalize_keys(combined_df['custacc'])
+    meter_index = build_key_index(meter_keys)
+    account_index = build_key_index(account_keys)
+    combined_df['meterno_key'] = encode_keys(meter_keys, meter_index)
+    combined_df['custacc_key'] = encode_keys(account_keys, account_index)
+    
+    # Report IDs repeated or spelt differently within the same file
+    key_issues = pd.concat([
+        key_report(combined_df, 'meterno', 'meterno_key', meter_index, 'source_file'),
+        key_report(combined_df, 'custacc', 'custacc_key', account_index, 'source_file'),
+    ], ignore_index=True)
+    if not key_issues.empty:
+        st.warning(f"Found {len(key_issues)} duplicate or conflicting meterno/custacc key(s):")
+        st.dataframe(key_issues)
+    
+    # Sort by meterno and custacc to detect changes (the key indexes are sorted, so codes keep that order)
+    combined_df = combined_df.sort_values(by=['meterno_key', 'custacc_key'], kind='stable')
+    
+    # Rows with a missing ID are left out of the groups (code -1 is not a real meter or account)
+    meter_groups = combined_df['meterno_key'].where(combined_df['meterno_key'] >= 0)
+    account_groups = combined_df['custacc_key'].where(combined_df['custacc_key'] >= 0)
     
     # Detect changes in custacc for the same meterno
-    combined_df['custacc_change'] = combined_df.groupby('meterno')['custacc'].apply(lambda x: x != x.shift())
+    custacc_previous = combined_df.groupby(meter_groups)['custacc_key'].shift()
+    combined_df['custacc_change'] = combined_df['custacc_key'].ne(custacc_previous) & meter_groups.notna()
     
     # Detect changes in meterno for the same custacc
-    combined_df['meterno_change'] = combined_df.groupby('custacc')['meterno'].apply(lambda x: x != x.shift())
+    meterno_previous = combined_df.groupby(account_groups)['meterno_key'].shift()
+    combined_df['meterno_change'] = combined_df['meterno_key'].ne(meterno_previous) & account_groups.notna()
+    combined_df = combined_df.drop(columns=['meterno_key', 'custacc_key'])
     
     # Display the combined dataframe with detected changes
     st.write("Processed Data:")
@@ -5,6 +5,7 @@ import io
 import os
 from pathlib import Path
 import re
+from workbook_reader import check_sheet_pattern, read_workbook_sheets, concat_sheets
 
 st.set_page_config(page_title="Merge Files into Excel", layout="centered")
 
@@ -16,18 +17,29 @@ uploaded_files = st.file_uploader(
     accept_multiple_files=True
 )
 
+read_all_sheets = st.checkbox("Read every sheet of each Excel workbook (not just the first)")
+sheet_pattern = st.text_input("Only sheets whose name matches (regex, optional):") if read_all_sheets else ""
+
+try:
+    check_sheet_pattern(sheet_pattern)
+except ValueError as e:
+    st.error(f"❌ {e}")
+    st.stop()
+
 def clean_sheet_name(name):
     name = Path(name).stem
     name = re.sub(r'[^A-Za-z0-9_]', '_', name)
     return name[:31]  # Excel sheet name max length
 
-def read_file(file, filename, chunksize=None):
+def read_file(file, filename, chunksize=None, all_sheets=False, sheet_pattern=None):
     suffix = Path(filename).suffix.lower()
     if suffix == '.csv':
         if chunksize:
             return pd.read_csv(file, chunksize=chunksize)
         return pd.read_csv(file)
     elif suffix in ['.xls', '.xlsx']:
+        if all_sheets:
+            return concat_sheets(read_workbook_sheets(file, pattern=sheet_pattern))
         return pd.read_excel(file)
     else:
         raise ValueError("Unsupported file format")
@@ -81,7 +93,7 @@ if uploaded_files:
             st.write(f"🔄 Processing `{fname}` ...")
             try:
                 # For CSVs, support memory-efficient read (if needed, here chunking is skipped for Excel output)
-                df = read_file(file_obj, fname)
+                df = read_file(file_obj, fname, all_sheets=read_all_sheets, sheet_pattern=sheet_pattern)
                 if hasattr(df, '__iter__') and not isinstance(df, pd.DataFrame):
                     df = pd.concat(df)
 
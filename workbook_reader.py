@@ -0,0 +1,42 @@
+import re
+
+import pandas as pd
+
+# Function to check a user-supplied sheet name pattern before any workbook is read
+def check_sheet_pattern(pattern):
+    if not pattern:
+        return
+    try:
+        re.compile(pattern)
+    except re.error as e:
+        raise ValueError(f"Invalid sheet name pattern `{pattern}`: {e}")
+
+# Function to pick which sheets of a workbook to ingest
+def select_sheets(sheet_names, sheets=None, pattern=None):
+    if sheets:
+        missing = [name for name in sheets if name not in sheet_names]
+        if missing:
+            raise ValueError(f"Sheet(s) not found in workbook: {', '.join(missing)}")
+        return list(sheets)
+    if pattern:
+        check_sheet_pattern(pattern)
+        regex = re.compile(pattern, re.IGNORECASE)
+        return [name for name in sheet_names if regex.search(name)]
+    return list(sheet_names)
+
+# Function to open a workbook once and parse the selected sheets from it
+def read_workbook_sheets(file, sheets=None, pattern=None, **read_kwargs):
+    # The sheet list comes from the workbook metadata, and every sheet is parsed from the
+    # same open workbook, so shared strings and styles are loaded only once per file
+    with pd.ExcelFile(file) as workbook:
+        selected = select_sheets(workbook.sheet_names, sheets, pattern)
+        if not selected:
+            raise ValueError(f"No sheets match `{pattern}` (available: {', '.join(workbook.sheet_names)})")
+        return pd.read_excel(workbook, sheet_name=selected, **read_kwargs)
+
+# Function to stack the sheets of one workbook into a single frame, tagged by sheet name
+def concat_sheets(frames, sheet_column='Sheet'):
+    tagged = [df.assign(**{sheet_column: name}) for name, df in frames.items() if not df.empty]
+    if not tagged:
+        return pd.DataFrame()
+    return pd.concat(tagged, ignore_index=True)